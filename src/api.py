@@ -3,12 +3,80 @@ API routes module for RoadBox
 Defines Flask endpoints and request handling
 """
 
-import json
+import logging
 import time
-from flask import jsonify, request, render_template
+import orjson
+import shapely
+import numpy as np
+from flask import Response, jsonify, request, render_template, stream_with_context
 from . import data
 from .network import find_route as calculate_route
 
+# Number of [lon, lat] pairs serialized per streamed chunk
+_route_chunk_size = 4096
+
+# Number of GeoJSON features serialized per streamed chunk
+_feature_chunk_size = 1024
+
+_log = logging.getLogger(__name__)
+
+
+def _stream_route_json(result):
+    """
+    Serialize a route result as JSON, streaming the coordinates in chunks
+
+    Long routes carry tens of thousands of coordinates; emitting them in
+    chunks keeps memory flat and lets the client start receiving data
+    before the whole response is serialized.
+    """
+    coords = result['route']['coordinates']
+    yield b'{"route":{"type":"LineString","coordinates":['
+
+    for start in range(0, len(coords), _route_chunk_size):
+        if start > 0:
+            yield b','
+        # Strip the surrounding brackets so chunks join into one array
+        chunk = coords[start:start + _route_chunk_size]
+        yield orjson.dumps(chunk, option=orjson.OPT_SERIALIZE_NUMPY)[1:-1]
+
+    # Remaining fields (distance, roads, nodes) close the object
+    metadata = {key: value for key, value in result.items() if key != 'route'}
+    yield b']},' + orjson.dumps(metadata)[1:]
+
+
+def _stream_geojson(gdf, start_time):
+    """
+    Serialize a GeoDataFrame as a GeoJSON FeatureCollection in one pass
+
+    Produces the same document as gdf.to_json(), but geometries are
+    written by shapely.to_geojson (GEOS, vectorized) and properties by
+    orjson, and features are streamed in chunks rather than built into one
+    string, parsed back and serialized again.
+
+    The request time (from start_time) is logged once the last chunk has
+    been produced, so it includes serialization.
+    """
+    properties = gdf.drop(columns=gdf.geometry.name).to_dict('records')
+    geometries = shapely.to_geojson(gdf.geometry.to_numpy())
+    ids = gdf.index.astype(str).tolist()
+    yield b'{"type":"FeatureCollection","features":['
+
+    for start in range(0, len(ids), _feature_chunk_size):
+        features = []
+        for i in range(start, min(start + _feature_chunk_size, len(ids))):
+            geometry = geometries[i].encode() if geometries[i] is not None else b'null'
+            # Splice the prebuilt geometry JSON in before the closing brace
+            feature = orjson.dumps({'id': ids[i], 'type': 'Feature',
+                                    'properties': properties[i]},
+                                   option=orjson.OPT_SERIALIZE_NUMPY)
+            features.append(feature[:-1] + b',"geometry":' + geometry + b'}')
+        yield (b',' if start > 0 else b'') + b','.join(features)
+
+    yield b']}'
+
+    processing_time = time.time() - start_time
+    _log.debug("Served %d features in %.3fs", len(ids), processing_time)
+
 
 def register_routes(app):
     """Register all API routes with the Flask app"""
@@ -31,27 +99,25 @@ def register_routes(app):
         # Get query parameters
         bbox_str = request.args.get('bbox')
 
-        # Parse bounding box
+        # Parse bounding box (minx,miny,maxx,maxy) in a single NumPy conversion
         bbox = None
         if bbox_str:
             try:
-                bbox = [float(x) for x in bbox_str.split(',')]
-            except:
-                pass
+                bbox = np.array(bbox_str.split(','), dtype=np.float64)
+            except ValueError:
+                bbox = None
+            if bbox is not None and bbox.size != 4:
+                bbox = None
 
         # Filter by bounding box (viewport)
-        if bbox:
+        if bbox is not None:
             filtered_gdf = data.filter_by_bbox(gdf, bbox)
         else:
             filtered_gdf = gdf
 
-        # Convert to GeoJSON
-        geojson = json.loads(filtered_gdf.to_json())
-
-        processing_time = time.time() - start_time
-        print(f"Served {len(filtered_gdf)} features in {processing_time:.3f}s")
-
-        return jsonify(geojson)
+        # Stream the GeoJSON straight to the client
+        return Response(stream_with_context(_stream_geojson(filtered_gdf, start_time)),
+                        mimetype='application/json')
 
     @app.route('/api/route', methods=['POST'])
     def find_route():
@@ -72,7 +138,8 @@ def register_routes(app):
         if 'error' in result:
             return jsonify(result), 400
 
-        return jsonify(result)
+        return Response(stream_with_context(_stream_route_json(result)),
+                        mimetype='application/json')
 
     @app.route('/api/health')
     def health_check():
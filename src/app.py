@@ -5,7 +5,9 @@ Main application module for road network analysis and pathfinding
 
 import os
 import yaml
+import orjson
 from flask import Flask
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from .api import register_routes
 from .network import build_road_network
@@ -19,6 +21,27 @@ def load_config():
         return yaml.safe_load(f)
 
 
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson
+
+    orjson is much faster than the standard json module on large lists of
+    floats and serializes NumPy arrays (such as route coordinates) directly.
+    """
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.options).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.options),
+                                        mimetype='application/json')
+
+
 def create_app():
     """
     Create and configure Flask application
@@ -37,6 +60,9 @@ def create_app():
     # Apply configuration to Flask app
     app.config.update(config)
 
+    # Serialize JSON responses with orjson (handles NumPy arrays natively)
+    app.json = OrjsonProvider(app)
+
     # Enable CORS (Cross-Origin Resource Sharing) for API access
     # This allows the frontend JavaScript to communicate with our backend
     CORS(app)
@@ -55,12 +81,10 @@ def initialize_network():
     """
     Initialize the road network graph for pathfinding
 
-    This creates two representations of the road network:
-    1. NetworkX graph (readable, good for analysis)
-    2. iGraph version (optimized for fast pathfinding with Dijkstra's algorithm)
-
-    The dual approach provides both algorithmic transparency and
-    high performance for interactive use.
+    The network is assembled from NumPy arrays of road segments and packed
+    into a CSR adjacency optimized for fast pathfinding with Dijkstra's
+    algorithm. The built network is cached on disk, so later startups skip
+    the build while the data file is unchanged.
 
     Returns:
         True if network built successfully, False otherwise
@@ -69,10 +93,9 @@ def initialize_network():
     try:
         network = build_road_network()
         if network:
-            nodes = network.number_of_nodes()
-            edges = network.number_of_edges()
+            nodes = network.vcount()
+            edges = network.ecount()
             print(f"✅ Network ready! {nodes} junctions, {edges} road segments")
-            print("   Both NetworkX (analysis) and iGraph (performance) versions created")
             return True
         else:
             print("❌ Failed to build pathfinding network")
@@ -87,8 +110,13 @@ app = create_app()
 
 
 if __name__ == '__main__':
-    # Initialize network on startup
-    initialize_network()
+    # The reloader only makes sense for development with debug enabled
+    use_reloader = app.config.get('use_reloader', False) and app.config.get('debug', False)
+
+    # Initialize network on startup - in the process that serves requests,
+    # not in the reloader's watcher process
+    if not use_reloader or os.environ.get('WERKZEUG_RUN_MAIN'):
+        initialize_network()
 
     # Run the app directly (for development)
     app.run(
@@ -96,5 +124,5 @@ if __name__ == '__main__':
         host=app.config['host'],
         port=app.config['port'],
         threaded=app.config['threaded'],
-        use_reloader=app.config['use_reloader']
+        use_reloader=use_reloader
     )
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+RoadBox Network Cache Module
+Simple functions for persisting the routing network between runs
+
+This module provides:
+- Binary .npy storage of the network arrays
+- Memory-mapped loading for near-instant startup
+- Automatic invalidation when the source data file changes
+"""
+
+import os
+import json
+import numpy as np
+from contextlib import contextmanager
+from typing import Optional, Dict, Any
+
+# Cache location - bump the version suffix whenever the build output changes
+# (array layout, edge weights, tolerances, connections), or a stale cache
+# built by older code will be loaded as if it were current
+_cache_dir = os.path.join('cache', 'network_v17')
+_manifest_path = os.path.join(_cache_dir, 'manifest.json')
+
+
+def _source_signature(source_path: str) -> Dict[str, Any]:
+    """Describe the source data file so changes to it invalidate the cache"""
+    stat = os.stat(source_path)
+    return {'path': source_path, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def load_network(source_path: Optional[str]) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Load cached network arrays if they were built from the current source file
+
+    Arrays are memory-mapped read-only, so loading costs almost nothing
+    until the data is actually touched.
+
+    Args:
+        source_path: Path of the data file the network is built from
+
+    Returns:
+        Dictionary of network arrays, or None if there is no valid cache
+    """
+    if not source_path or not os.path.exists(source_path):
+        return None
+
+    if not os.path.exists(_manifest_path):
+        return None
+
+    try:
+        with open(_manifest_path, 'r') as f:
+            manifest = json.load(f)
+
+        if manifest.get('source') != _source_signature(source_path):
+            print("Network cache is out of date - rebuilding")
+            return None
+
+        return {
+            name: np.load(os.path.join(_cache_dir, f"{name}.npy"), mmap_mode='r')
+            for name in manifest['arrays']
+        }
+
+    except Exception as e:
+        print(f"Error loading network cache: {e}")
+        return None
+
+
+def save_network(source_path: Optional[str], arrays: Dict[str, np.ndarray]) -> bool:
+    """
+    Save the network to the on-disk cache
+
+    Each file is written under a temporary name and then renamed into
+    place. Processes that already memory-map the previous cache keep
+    their (now unlinked) files intact instead of seeing them truncated,
+    and every process that loads the cache shares the same page-cache
+    copy of the arrays.
+
+    Args:
+        source_path: Path of the data file the network was built from
+        arrays: Dictionary of NumPy arrays describing the network
+
+    Returns:
+        True if the cache was written, False otherwise
+    """
+    if not source_path or not os.path.exists(source_path):
+        return False
+
+    try:
+        os.makedirs(_cache_dir, exist_ok=True)
+
+        # Remove the old manifest first so a partially written cache is never used
+        if os.path.exists(_manifest_path):
+            os.remove(_manifest_path)
+
+        for name, array in arrays.items():
+            with _replace_file(os.path.join(_cache_dir, f"{name}.npy"), 'wb') as f:
+                np.save(f, np.ascontiguousarray(array))
+
+        manifest = {
+            'source': _source_signature(source_path),
+            'arrays': sorted(arrays)
+        }
+        with _replace_file(_manifest_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        print(f"Saved network cache to {_cache_dir}")
+        return True
+
+    except Exception as e:
+        print(f"Error saving network cache: {e}")
+        return False
+
+
+@contextmanager
+def _replace_file(path: str, mode: str):
+    """Write a file under a temporary name and rename it over path when done"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, mode) as f:
+            yield f
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -4,46 +4,107 @@ Simple functions for network building and pathfinding
 
 This module provides:
 - Graph theory applied to road networks
-- Dijkstra's shortest path algorithm
-- Hybrid NetworkX/iGraph approach for performance
+- Dijkstra's shortest path algorithm (bidirectional A* for point-to-point queries)
+- Array-based network construction with CSR adjacency for the searches
 - Geographic data processing for routing
+- On-disk caching of the built network for fast startup
 """
 
+import logging
 import time
-import networkx as nx
+import threading
 import igraph as ig
 import numpy as np
-from collections import defaultdict
-from typing import Tuple, Optional, Dict, Any, List
-from shapely.geometry import Point
-from . import data
+import shapely
+from collections import OrderedDict
+from functools import lru_cache
+from math import sqrt
+from numba import njit, prange
+from typing import Tuple, Optional, Dict, Any
+from . import cache, data, routing
+
+# SciPy is optional: without it nearest-node lookups fall back to a
+# compiled linear scan and shortest path trees to a Numba Dijkstra
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+# Per-request messages (lookups, routes) go through this logger at DEBUG
+# level, so they cost nothing unless debug logging is switched on
+_log = logging.getLogger(__name__)
 
 # Module-level variables for network state
-_road_network: Optional[nx.Graph] = None
 _fast_graph: Optional[ig.Graph] = None
 _node_mapping: Optional[Dict[str, Any]] = None
-
-
-def build_road_network() -> Optional[nx.Graph]:
+_adjacency: Optional[Dict[str, np.ndarray]] = None
+_csgraph: Optional["routing.csr_matrix"] = None
+_search_points: Optional[np.ndarray] = None
+_node_lons: Optional[np.ndarray] = None
+_node_lats: Optional[np.ndarray] = None
+_node_tree: Optional["cKDTree"] = None
+_edge_nodes: Optional[np.ndarray] = None
+_edge_sources: Optional[np.ndarray] = None
+_edge_weights: Optional[np.ndarray] = None
+_edge_road_type_ids: Optional[np.ndarray] = None
+_road_type_names: Optional[np.ndarray] = None
+_coord_buffer: Optional[np.ndarray] = None
+_edge_offsets: Optional[np.ndarray] = None
+_build_lock = threading.Lock()
+
+# Shortest path trees for start nodes that are routed from repeatedly
+# (tree arrays hold the incoming tree edge of every node, -1 if none)
+_path_trees: Dict[int, np.ndarray] = OrderedDict()
+_recent_sources: Dict[int, None] = OrderedDict()
+_path_tree_lock = threading.Lock()
+_max_path_trees = 32
+_max_recent_sources = 256
+
+
+def build_road_network() -> Optional[ig.Graph]:
     """
-    Build NetworkX graph from road data for pathfinding
+    Build the routing graph from road data for pathfinding
 
     This method creates a mathematical graph representation of the road network:
     - Nodes represent road intersections and endpoints
     - Edges represent road segments connecting nodes
     - Weights represent travel cost (distance in this case)
 
+    The network is assembled from NumPy arrays of road segments (one row
+    per edge), packed into the arrays the searches run on and saved to an
+    on-disk cache. Later
+    startups load the cache instead of rebuilding as long as the source
+    data file is unchanged.
+
     Returns:
-        NetworkX Graph object ready for pathfinding algorithms
+        iGraph Graph of the network topology (node and edge counts), or
+        None if the network could not be built
     """
-    global _road_network, _fast_graph, _node_mapping
+    if _fast_graph is not None:
+        return _fast_graph
+
+    # Concurrent first requests on the threaded server wait for one build
+    with _build_lock:
+        if _fast_graph is not None:
+            return _fast_graph
+        return _build_road_network()
 
-    if _road_network is not None:
-        return _road_network
 
+def _build_road_network() -> Optional[ig.Graph]:
+    """Load the network from the cache or build it from the road data"""
     print("Building road network for pathfinding...")
     start_time = time.time()
 
+    # Reuse the network from a previous run if the source data is unchanged
+    source_path = data.get_dataset_path('motorways')
+    cached = cache.load_network(source_path)
+    if cached is not None:
+        ig_graph = _load_network_arrays(cached)
+        load_time = time.time() - start_time
+        print(f"Loaded cached network: {ig_graph.vcount()} nodes, "
+              f"{ig_graph.ecount()} edges in {load_time:.2f}s")
+        return ig_graph
+
     # Load motorways dataset for pathfinding
     motorways = data.load_dataset('motorways')
 
@@ -54,60 +115,151 @@ def build_road_network() -> Optional[nx.Graph]:
     all_roads = motorways
     print(f"Using MOTORWAYS ONLY for pathfinding network ({len(all_roads)} segments)")
 
-    # Create empty graph - this will hold our road network
-    G = nx.Graph()
-
-    # Process each road segment and add it to the graph
-    for idx, row in all_roads.iterrows():
-        geom = row.geometry
-        road_type = row.get('road_classification_number', 'Unknown')
-
-        if geom.geom_type == 'LineString':
-            coords = list(geom.coords)
-            if len(coords) >= 2:
-                # Get start and end points of this road segment
-                start_point = coords[0]  # (longitude, latitude)
-                end_point = coords[-1]
-
-                # Calculate segment length for routing weight
-                # Convert from degrees to meters (approximate conversion)
-                length = geom.length * 111000
-
-                # Create unique identifiers for nodes
-                start_node = f"node_{start_point[0]:.6f}_{start_point[1]:.6f}"
-                end_node = f"node_{end_point[0]:.6f}_{end_point[1]:.6f}"
-
-                # Add nodes to graph with their geographic coordinates
-                G.add_node(start_node, lat=start_point[1], lon=start_point[0])
-                G.add_node(end_node, lat=end_point[1], lon=end_point[0])
-
-                # Add edge between nodes with routing weight (distance)
-                G.add_edge(start_node, end_node,
-                          weight=length,
-                          length=length,
-                          road_type=road_type,
-                          segment_id=f"seg_{idx}",
-                          geometry=coords)
+    # Work on whole columns at once rather than row by row
+    roads = all_roads[(all_roads.geometry.geom_type == 'LineString').to_numpy()]
+    if 'road_classification_number' in roads.columns:
+        road_types = roads['road_classification_number'].to_numpy()
+    else:
+        road_types = np.full(len(roads), 'Unknown', dtype=object)
+
+    # Flatten all segment coordinates into one (N, 2) array of (longitude, latitude)
+    coords, coord_index = shapely.get_coordinates(roads.geometry.to_numpy(), return_index=True)
+    # Snap to the 6-decimal grid of the node keys, so segment lengths are
+    # measured between exactly the node positions the A* heuristic uses
+    coords = np.round(coords, 6)
+    counts = np.bincount(coord_index, minlength=len(roads))
+    seg_ends = np.cumsum(counts)
+    seg_starts = seg_ends - counts
+
+    # Only segments with at least two points describe a road
+    valid = np.flatnonzero(counts >= 2)
+    start_points = coords[seg_starts[valid]]
+    end_points = coords[seg_ends[valid] - 1]
+
+    # Calculate segment lengths for routing weight: great-circle distance
+    # between consecutive points, summed per segment in one pass
+    same_segment = coord_index[1:] == coord_index[:-1]
+    step_lengths = routing.haversine_distance(coords[:-1, 0][same_segment], coords[:-1, 1][same_segment],
+                                              coords[1:, 0][same_segment], coords[1:, 1][same_segment])
+    lengths = np.bincount(coord_index[1:][same_segment], weights=step_lengths,
+                          minlength=len(roads))[valid]
+
+    # Create unique identifiers for nodes and number them in key order
+    # (sorted Morton keys give a spatially coherent Z-order numbering)
+    start_keys = _node_keys(start_points[:, 0], start_points[:, 1])
+    end_keys = _node_keys(end_points[:, 0], end_points[:, 1])
+    node_keys, endpoint_index = np.unique(np.concatenate((start_keys, end_keys)),
+                                          return_inverse=True)
+    endpoint_index = endpoint_index.ravel()
+
+    # One row per road segment, with routing weight (distance); each
+    # geometry runs from the segment's first node to its second
+    edges = {
+        'nodes': np.column_stack((endpoint_index[:len(valid)], endpoint_index[len(valid):])),
+        'weights': lengths,
+        'road_types': road_types[valid],
+        'geometries': [coords[seg_start:seg_end] for seg_start, seg_end in
+                       zip(seg_starts[valid].tolist(), seg_ends[valid].tolist())],
+    }
+
+    # Segments joining the same two nodes collapse into a single edge
+    edges = _drop_parallel_edges(edges, len(node_keys))
 
     build_time = time.time() - start_time
-    initial_nodes = G.number_of_nodes()
-    initial_edges = G.number_of_edges()
-    print(f"Initial network: {initial_nodes} nodes, {initial_edges} edges in {build_time:.2f}s")
+    print(f"Initial network: {len(node_keys)} nodes, {len(edges['weights'])} edges in {build_time:.2f}s")
 
     # Connect road segments that are close to each other (intersections)
-    _connect_adjacent_segments(G)
+    edges = _connect_adjacent_segments(node_keys, edges)
 
     # Keep only the largest connected component for pathfinding
-    G = _get_largest_component(G)
+    node_keys, edges = _get_largest_component(node_keys, edges)
 
-    # Create a faster version using igraph for routing calculations
-    _build_igraph(G)
+    # Flatten into the arrays (CSR adjacency, coordinate buffer) the searches run on
+    network_arrays = _build_network_arrays(node_keys, edges)
+    ig_graph = _load_network_arrays(network_arrays)
 
-    _road_network = G
-    return G
+    # Save the arrays so the next startup can skip the build entirely
+    cache.save_network(source_path, network_arrays)
 
+    return ig_graph
+
+
+def _node_keys(lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+    """
+    Pack coordinates into int64 Morton (Z-order) node identifiers
+
+    Coordinates are rounded to 6 decimal places (~0.1m) and shifted to
+    non-negative integers, then the bits of longitude and latitude are
+    interleaved. Integer keys hash and compare much faster than formatted
+    strings, and nodes that are close on the map get close keys, so
+    sorting by key gives a spatially coherent node order.
+    """
+    x = (np.round(np.asarray(lons) * 1e6).astype(np.int64) + 180_000_000).astype(np.uint64)
+    y = (np.round(np.asarray(lats) * 1e6).astype(np.int64) + 90_000_000).astype(np.uint64)
+    return (_spread_bits(x) | (_spread_bits(y) << np.uint64(1))).astype(np.int64)
+
+
+def _key_coords(keys) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Unpack int64 node identifiers back into (lons, lats) arrays
 
-def _connect_adjacent_segments(G: nx.Graph):
+    The node key is the single source of truth for node coordinates, so
+    no per-node lat/lon attributes need to be stored in the graph.
+    """
+    keys = np.asarray(keys, dtype=np.int64).astype(np.uint64)
+    lons = (_compact_bits(keys).astype(np.int64) - 180_000_000) / 1e6
+    lats = (_compact_bits(keys >> np.uint64(1)).astype(np.int64) - 90_000_000) / 1e6
+    return lons, lats
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """Move the low 32 bits of each value to the even bit positions"""
+    values = values & np.uint64(0xFFFFFFFF)
+    for shift, mask in ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF),
+                        (4, 0x0F0F0F0F0F0F0F0F), (2, 0x3333333333333333),
+                        (1, 0x5555555555555555)):
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
+def _compact_bits(values: np.ndarray) -> np.ndarray:
+    """Gather the even bit positions of each value into its low 32 bits (inverse of _spread_bits)"""
+    values = values & np.uint64(0x5555555555555555)
+    for shift, mask in ((1, 0x3333333333333333), (2, 0x0F0F0F0F0F0F0F0F),
+                        (4, 0x00FF00FF00FF00FF), (8, 0x0000FFFF0000FFFF),
+                        (16, 0x00000000FFFFFFFF)):
+        values = (values | (values >> np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
+def _select_edges(edges: Dict[str, Any], keep: np.ndarray) -> Dict[str, Any]:
+    """Take the rows of an edge table at the given positions"""
+    return {
+        'nodes': edges['nodes'][keep],
+        'weights': edges['weights'][keep],
+        'road_types': edges['road_types'][keep],
+        'geometries': [edges['geometries'][i] for i in keep.tolist()],
+    }
+
+
+def _pair_codes(u: np.ndarray, v: np.ndarray, num_nodes: int) -> np.ndarray:
+    """Encode unordered node pairs as single integers"""
+    return np.minimum(u, v) * num_nodes + np.maximum(u, v)
+
+
+def _drop_parallel_edges(edges: Dict[str, Any], num_nodes: int) -> Dict[str, Any]:
+    """
+    Keep one edge per pair of nodes
+
+    The routing graph is simple (no parallel edges). When several segments
+    join the same two nodes, the last one in the data wins.
+    """
+    codes = _pair_codes(edges['nodes'][:, 0], edges['nodes'][:, 1], num_nodes)
+    _, last_from_end = np.unique(codes[::-1], return_index=True)
+    return _select_edges(edges, np.sort(len(codes) - 1 - last_from_end))
+
+
+def _connect_adjacent_segments(node_keys: np.ndarray, edges: Dict[str, Any]) -> Dict[str, Any]:
     """
     Connect adjacent motorway segments to form a connected network
 
@@ -116,64 +268,153 @@ def _connect_adjacent_segments(G: nx.Graph):
 
     This is crucial for pathfinding - without connections, routes can't cross
     between different road segments.
+
+    Returns:
+        Edge table with the connection edges appended
     """
     print("Connecting adjacent motorway segments...")
     gap_start_time = time.time()
 
-    # Group nearby endpoints for efficient connection finding
-    endpoint_to_segments = defaultdict(list)
     tolerance = 0.002  # ~200m tolerance - roads this close should connect
 
-    # Find all road endpoints and group them by location
-    for node in G.nodes():
-        node_data = G.nodes[node]
-        lat, lon = node_data['lat'], node_data['lon']
-
-        # Round coordinates to create spatial groups
-        # This groups nearby endpoints together for efficient processing
-        rounded_lat = round(lat / tolerance) * tolerance
-        rounded_lon = round(lon / tolerance) * tolerance
-        endpoint_key = (rounded_lat, rounded_lon)
-
-        endpoint_to_segments[endpoint_key].append(node)
-
-    # Connect nodes that are very close to each other
-    connections_made = 0
-    for endpoint_key, nodes in endpoint_to_segments.items():
-        if len(nodes) > 1:
-            # Multiple road endpoints in the same area - likely an intersection
-            # Connect all pairs to ensure full connectivity
-            for i in range(len(nodes)):
-                for j in range(i + 1, len(nodes)):
-                    node1, node2 = nodes[i], nodes[j]
-
-                    if not G.has_edge(node1, node2):
-                        # Calculate actual distance between the two points
-                        node1_data = G.nodes[node1]
-                        node2_data = G.nodes[node2]
-
-                        lat1, lon1 = node1_data['lat'], node1_data['lon']
-                        lat2, lon2 = node2_data['lat'], node2_data['lon']
-
-                        # Simple Euclidean distance in degrees, then convert to meters
-                        distance_deg = ((lat2-lat1)**2 + (lon2-lon1)**2)**0.5
-                        distance_m = distance_deg * 111000
-
-                        # Only connect if within tolerance distance
-                        if distance_m <= tolerance * 111000:
-                            G.add_edge(node1, node2,
-                                      weight=distance_m,
-                                      length=distance_m,
-                                      road_type='MOTORWAY_CONNECTION',
-                                      segment_id=f'connection_{connections_made}')
-                            connections_made += 1
+    num_nodes = len(node_keys)
+    lons, lats = _key_coords(node_keys)
+
+    # Find every pair of endpoints within tolerance of each other
+    if cKDTree is not None:
+        pair_u, pair_v = _tree_pairs(lats, lons, tolerance)
+    else:
+        pair_u, pair_v = _grid_pairs(lats, lons, tolerance)
+
+    # Skip pairs a road segment already joins
+    existing = _pair_codes(edges['nodes'][:, 0], edges['nodes'][:, 1], num_nodes)
+    new = ~np.isin(_pair_codes(pair_u, pair_v, num_nodes), existing)
+    pair_u, pair_v = pair_u[new], pair_v[new]
+    pair_dist = routing.haversine_distance(lons[pair_u], lats[pair_u], lons[pair_v], lats[pair_v])
+
+    # Connections are straight lines between the two endpoints
+    connection_geometries = np.stack((np.column_stack((lons[pair_u], lats[pair_u])),
+                                      np.column_stack((lons[pair_v], lats[pair_v]))), axis=1)
+
+    connected = {
+        'nodes': np.concatenate((edges['nodes'], np.column_stack((pair_u, pair_v)))),
+        'weights': np.concatenate((edges['weights'], pair_dist)),
+        'road_types': np.concatenate((edges['road_types'],
+                                      np.full(len(pair_u), 'MOTORWAY_CONNECTION', dtype=object))),
+        'geometries': edges['geometries'] + list(connection_geometries),
+    }
+    connections_made = len(pair_u)
 
     gap_time = time.time() - gap_start_time
     print(f"Connectivity complete in {gap_time:.2f}s")
     print(f"Created {connections_made} connections between road segments")
 
+    return connected
+
+
+def _tree_pairs(lats: np.ndarray, lons: np.ndarray,
+                tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find all node pairs within tolerance with one KD-tree radius search
+
+    cKDTree.query_pairs runs the whole search in C over the packed
+    coordinate array. Pairs are sorted so the connections (and their
+    segment ids) come out in a stable order.
+
+    Returns:
+        Arrays (u, v) of node positions to connect
+    """
+    pairs = cKDTree(np.column_stack((lats, lons))).query_pairs(r=tolerance, output_type='ndarray')
+    pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+    return pairs[:, 0], pairs[:, 1]
+
+
+def _grid_pairs(lats: np.ndarray, lons: np.ndarray,
+                tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find all node pairs within tolerance with a hash grid
+
+    Used when SciPy is not installed. Nodes are binned into square cells
+    one tolerance wide, each cell gets a single int64 id and one argsort
+    lays every cell's nodes out contiguously. Any pair within tolerance
+    then lies in the same or an adjacent cell, so the search finds the
+    same pairs as the KD-tree.
 
-def _get_largest_component(G: nx.Graph) -> nx.Graph:
+    Returns:
+        Arrays (u, v) of node positions to connect
+    """
+    cell_rows = np.floor(lats / tolerance).astype(np.int64)
+    cell_cols = np.floor(lons / tolerance).astype(np.int64)
+    # Pad by one cell on each side so neighbouring ids never wrap around a row
+    cell_rows -= cell_rows.min() - 1
+    cell_cols -= cell_cols.min() - 1
+    row_stride = int(cell_cols.max()) + 2
+    cell_ids = cell_rows * row_stride + cell_cols
+
+    order = np.argsort(cell_ids, kind='stable')
+    pair_u, pair_v = _emit_pairs(cell_ids[order], order, row_stride, lats, lons, tolerance)
+
+    # Same orientation and order as the KD-tree search
+    pair_u, pair_v = np.minimum(pair_u, pair_v), np.maximum(pair_u, pair_v)
+    pair_order = np.lexsort((pair_v, pair_u))
+    return pair_u[pair_order], pair_v[pair_order]
+
+
+@njit(parallel=True, cache=True)
+def _emit_pairs(sorted_cells, order, row_stride, lats, lons, tolerance):
+    """
+    Compare every node with the nodes in its own and neighbouring cells
+
+    Compiled with Numba and spread across CPU cores with prange. Each node
+    only looks at later nodes in its own cell and at four of its eight
+    neighbouring cells, so every pair is visited exactly once. A first
+    pass counts the pairs per node and a second writes them into that
+    node's slice of the output arrays.
+
+    Returns:
+        Arrays (u, v) of node positions to connect
+    """
+    num_nodes = sorted_cells.size
+    # Cells right, below-left, below and below-right of the current one
+    neighbor_offsets = np.array([1, row_stride - 1, row_stride, row_stride + 1],
+                                dtype=np.int64)
+
+    counts = np.zeros(num_nodes + 1, dtype=np.int64)
+    for write in range(2):
+        if write == 1:
+            slots = np.cumsum(counts)
+            pair_u = np.empty(slots[num_nodes], dtype=np.int64)
+            pair_v = np.empty(slots[num_nodes], dtype=np.int64)
+
+        for i in prange(num_nodes):
+            u = order[i]
+            cell = sorted_cells[i]
+            count = 0
+            for n in range(neighbor_offsets.size + 1):
+                if n == 0:
+                    start = i + 1
+                    end = np.searchsorted(sorted_cells, cell, side='right')
+                else:
+                    neighbor = cell + neighbor_offsets[n - 1]
+                    start = np.searchsorted(sorted_cells, neighbor, side='left')
+                    end = np.searchsorted(sorted_cells, neighbor, side='right')
+                for j in range(start, end):
+                    v = order[j]
+                    # Same Euclidean distance in degrees as the KD-tree radius
+                    if sqrt((lats[v] - lats[u])**2 + (lons[v] - lons[u])**2) <= tolerance:
+                        if write == 1:
+                            slot = slots[i] + count
+                            pair_u[slot] = u
+                            pair_v[slot] = v
+                        count += 1
+            if write == 0:
+                counts[i + 1] = count
+
+    return pair_u, pair_v
+
+
+def _get_largest_component(node_keys: np.ndarray,
+                           edges: Dict[str, Any]) -> Tuple[np.ndarray, Dict[str, Any]]:
     """
     Keep only the largest connected component of the road network
 
@@ -182,72 +423,155 @@ def _get_largest_component(G: nx.Graph) -> nx.Graph:
     - Pathfinding algorithms can only find routes within connected components
     - We keep the largest component to ensure most roads are accessible
 
-    This is a standard preprocessing step in network analysis.
+    This is a standard preprocessing step in network analysis. Components
+    are found by igraph in C; surviving nodes keep their relative order.
     """
     print("Finding largest connected component...")
-    components = list(nx.connected_components(G))
-    print(f"Found {len(components)} connected components")
+    graph = ig.Graph(n=len(node_keys), edges=edges['nodes'].tolist(), directed=False)
+    components = graph.connected_components()
+    sizes = np.array(components.sizes())
+    print(f"Found {len(sizes)} connected components")
 
-    if len(components) > 1:
-        # Sort components by number of nodes (largest first)
-        components_sorted = sorted(components, key=len, reverse=True)
-        largest_component = components_sorted[0]
+    if len(sizes) > 1:
+        largest_component = int(np.argmax(sizes))
 
-        print(f"Component sizes: {[len(c) for c in components_sorted[:5]]}...")
-        print(f"Keeping largest component with {len(largest_component)} nodes")
+        print(f"Component sizes: {sorted(sizes.tolist(), reverse=True)[:5]}...")
+        print(f"Keeping largest component with {sizes[largest_component]} nodes")
 
-        # Create a new graph containing only the largest component
-        G = G.subgraph(largest_component).copy()
+        # Renumber the surviving nodes and drop every edge outside the component
+        keep_nodes = np.array(components.membership) == largest_component
+        new_index = np.cumsum(keep_nodes) - 1
+        edges = _select_edges(edges, np.flatnonzero(keep_nodes[edges['nodes'][:, 0]]))
+        edges['nodes'] = new_index[edges['nodes']]
+        node_keys = node_keys[keep_nodes]
 
-        print(f"Final network: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
+        print(f"Final network: {len(node_keys)} nodes, {len(edges['weights'])} edges")
     else:
         print("Network is fully connected - no isolated components!")
 
-    return G
+    return node_keys, edges
 
 
-def _build_igraph(G: nx.Graph):
+def _build_network_arrays(node_keys: np.ndarray, edges: Dict[str, Any]) -> Dict[str, np.ndarray]:
     """
-    Convert NetworkX graph to igraph for fast routing
+    Flatten the edge table into plain NumPy arrays
 
-    Why use both libraries?
-    - NetworkX: Pure Python, full graph analysis capabilities
-    - iGraph: C implementation, 10-100x faster for large networks
+    Why arrays?
+    - They can be written to disk and memory-mapped back on startup
+    - Edge geometries share a single coordinate buffer instead of one
+      Python list per road segment
+
+    Edge geometry i is stored as coords[edge_offsets[i]:edge_offsets[i + 1]]
+    and always runs from node edges[i, 0] to node edges[i, 1], so the travel
+    direction along an edge follows from its source node alone. Connection
+    edges are stored as a straight line between their two nodes, so every
+    edge has at least two points.
+
+    Road types are stored once each in road_type_names (sorted), with a
+    small integer road_type_ids entry per edge pointing into it.
+
+    The CSR adjacency used by the search kernels is derived here too
+    (as adjacency_* arrays), so it is cached rather than rebuilt on load.
+
+    Coordinates are rounded to 6 decimals and stored as float32 (~1m
+    precision), halving memory for the coordinate tables. Edge weights
+    stay float64 since route lengths are summed from them; the adjacency
+    copy the searches read is float32.
     """
-    global _fast_graph, _node_mapping
+    print("Packing network arrays for routing...")
+    num_nodes = len(node_keys)
+    node_lons, node_lats = _key_coords(node_keys)
 
-    print("Converting to igraph for fast routing...")
-    # Create node mapping between NetworkX and iGraph indices
-    node_list = list(G.nodes())
-    node_to_index = {node: i for i, node in enumerate(node_list)}
+    geometries = edges['geometries']
+    edge_offsets = np.zeros(len(geometries) + 1, dtype=np.int64)
+    edge_offsets[1:] = np.cumsum([len(geometry) for geometry in geometries])
+    coords = np.concatenate(geometries) if geometries else np.empty((0, 2))
 
-    # Build edge list for igraph
-    edge_list = []
-    edge_weights = []
+    road_type_names, road_type_ids = np.unique(np.array(edges['road_types'], dtype=str),
+                                               return_inverse=True)
 
-    for u, v, data in G.edges(data=True):
-        edge_list.append((node_to_index[u], node_to_index[v]))
-        weight = data.get('weight', data.get('length', 1.0))
-        edge_weights.append(weight)
+    edge_nodes = np.asarray(edges['nodes'], dtype=np.int64).reshape(-1, 2)
+    weights = np.asarray(edges['weights'], dtype=np.float64)
+    adjacency = routing.build_adjacency(num_nodes, edge_nodes, weights)
 
-    # Create igraph instance
-    ig_graph = ig.Graph(n=len(node_list), edges=edge_list, directed=False)
-    ig_graph.es['weight'] = edge_weights
+    return {
+        'node_keys': np.asarray(node_keys, dtype=np.int64),
+        'node_lons': _quantize(node_lons),
+        'node_lats': _quantize(node_lats),
+        'edges': edge_nodes,
+        'weights': weights,
+        'road_type_names': road_type_names,
+        'road_type_ids': road_type_ids.ravel().astype(np.int16),
+        'edge_offsets': edge_offsets,
+        'coords': _quantize(coords).reshape(-1, 2),
+        **{f"adjacency_{name}": array for name, array in adjacency.items()},
+    }
 
-    # Store node data in igraph format
-    for i, node in enumerate(node_list):
-        node_data = G.nodes[node]
-        ig_graph.vs[i]['name'] = node
-        ig_graph.vs[i]['lat'] = node_data['lat']
-        ig_graph.vs[i]['lon'] = node_data['lon']
 
-    # Store both representations
-    _fast_graph = ig_graph
+def _quantize(values) -> np.ndarray:
+    """Round coordinates to 6 decimal places and store them as float32"""
+    return np.round(np.asarray(values, dtype=np.float64), 6).astype(np.float32)
+
+
+def _load_network_arrays(arrays: Dict[str, np.ndarray]) -> ig.Graph:
+    """
+    Set up the routing state from network arrays
+
+    Used both right after a fresh build and when loading the on-disk cache,
+    so both paths end up with identical routing state. Edge ids are row
+    positions in the edge array, which lets edge geometries be looked up
+    by edge id in the shared coordinate buffer.
+    """
+    global _fast_graph, _node_mapping, _adjacency, _csgraph, _search_points, _node_lons, _node_lats, _node_tree
+    global _edge_nodes, _edge_sources, _edge_weights, _edge_road_type_ids, _road_type_names
+    global _coord_buffer, _edge_offsets
+
+    node_list = arrays['node_keys'].tolist()
+    node_to_index = {node: i for i, node in enumerate(node_list)}
+
+    # igraph holds the topology only (node and edge counts); weights and
+    # coordinates live in the arrays below, which the searches run on
+    ig_graph = ig.Graph(n=len(node_list), edges=arrays['edges'].tolist(), directed=False)
+
+    # Node key <-> index lookups, plus a CSR adjacency for the search kernels
     _node_mapping = {'to_index': node_to_index, 'to_node': node_list}
+    _adjacency = {name: arrays[f"adjacency_{name}"]
+                  for name in ('indptr', 'neighbors', 'edge_ids', 'weights')}
+    _csgraph = routing.build_csgraph(_adjacency)
+    # Full-precision node positions on the unit sphere for the A* heuristic
+    _search_points = routing.sphere_points(*_key_coords(arrays['node_keys']))
+    # float32 coordinate columns for snapping and route output
+    _node_lons = arrays['node_lons']
+    _node_lats = arrays['node_lats']
+    # KD-tree over (lat, lon) for nearest-node lookups
+    _node_tree = None
+    if cKDTree is not None:
+        _node_tree = cKDTree(np.column_stack((_node_lats, _node_lons)).astype(np.float64))
+    # Edge attributes live in plain arrays indexed by edge id (the first
+    # node of each edge is where its stored geometry starts)
+    _edge_nodes = np.asarray(arrays['edges'])
+    _edge_sources = _edge_nodes[:, 0]
+    _edge_weights = np.asarray(arrays['weights'])
+    _edge_road_type_ids = arrays['road_type_ids']
+    _road_type_names = np.asarray(arrays['road_type_names'])
+    _coord_buffer = arrays['coords']
+    _edge_offsets = arrays['edge_offsets']
+
+    # Routes cached for the previous network are no longer valid
+    _route_between_nodes.cache_clear()
+    with _path_tree_lock:
+        _path_trees.clear()
+        _recent_sources.clear()
+
+    # Publish the graph last: build_road_network() hands it out without
+    # taking the lock, so every other global must already be in place
+    _fast_graph = ig_graph
+
+    return ig_graph
 
 
-def find_nearest_node(graph: nx.Graph, lat: float, lon: float,
-                     max_distance: Optional[float] = None) -> Tuple[Optional[str], float]:
+def find_nearest_node(graph: ig.Graph, lat: float, lon: float,
+                     max_distance: Optional[float] = None) -> Tuple[Optional[int], float]:
     """
     Find the nearest node in the road network to a given geographic point
 
@@ -266,24 +590,62 @@ def find_nearest_node(graph: nx.Graph, lat: float, lon: float,
     if max_distance is None:
         max_distance = tolerance
 
-    print(f"Finding nearest node within {max_distance*111:.0f}km of {lat:.4f}, {lon:.4f}")
+    _log.debug("Finding nearest node within %.0fkm of %.4f, %.4f", max_distance * 111, lat, lon)
 
-    min_distance = float('inf')
-    nearest_node = None
-    target_point = Point(lon, lat)
+    if _node_tree is not None:
+        # Query the prebuilt KD-tree - O(log n) instead of scanning every node
+        distance, nearest = _node_tree.query([lat, lon], k=1, distance_upper_bound=max_distance)
 
-    # Search through all nodes to find the closest one
-    # Note: This is O(n) complexity - could be optimized with spatial indexing for large networks
-    for node in graph.nodes():
-        node_data = graph.nodes[node]
-        node_point = Point(node_data['lon'], node_data['lat'])
-        distance = target_point.distance(node_point)
+        # The tree reports a missing neighbour as index n with infinite distance
+        if nearest >= _node_tree.n:
+            return None, float('inf')
+    else:
+        # No SciPy - scan all nodes with the compiled kernel instead
+        nearest, distance = _nearest_node_scan(_node_lats, _node_lons, lat, lon, max_distance)
+        if nearest < 0:
+            return None, float('inf')
+
+    return _node_mapping['to_node'][nearest], float(distance)
 
-        if distance < min_distance and distance <= max_distance:
-            min_distance = distance
-            nearest_node = node
 
-    return nearest_node, min_distance
+@njit(cache=True, parallel=True, fastmath=True)
+def _nearest_node_scan(lats, lons, lat, lon, max_distance):
+    """
+    Find the node closest to (lat, lon) within max_distance by brute force
+
+    The nodes are split into fixed tiles that are scanned in parallel with
+    prange; each tile keeps its own best candidate, and the tile winners
+    are reduced serially at the end, so no two threads share a running
+    minimum.
+
+    Returns:
+        Tuple of (node index, distance in degrees), or (-1, inf) if no
+        node is strictly within max_distance
+    """
+    num_nodes = lats.size
+    num_tiles = min(num_nodes, 256)
+    tile_best = np.full(num_tiles, max_distance * max_distance)
+    tile_index = np.full(num_tiles, -1, dtype=np.int64)
+
+    for t in prange(num_tiles):
+        for i in range(t * num_nodes // num_tiles, (t + 1) * num_nodes // num_tiles):
+            dy = lats[i] - lat
+            dx = lons[i] - lon
+            d = dx * dx + dy * dy
+            if d < tile_best[t]:
+                tile_best[t] = d
+                tile_index[t] = i
+
+    best = -1
+    best_d = np.inf
+    for t in range(num_tiles):
+        if tile_index[t] >= 0 and tile_best[t] < best_d:
+            best_d = tile_best[t]
+            best = tile_index[t]
+
+    if best < 0:
+        return -1, np.inf
+    return best, sqrt(best_d)
 
 
 def find_route(start_lat: float, start_lng: float,
@@ -308,7 +670,7 @@ def find_route(start_lat: float, start_lng: float,
     if graph is None:
         return {'error': 'Could not build road network'}
 
-    print(f"Finding route from {start_lat:.4f},{start_lng:.4f} to {end_lat:.4f},{end_lng:.4f}")
+    _log.debug("Finding route from %.4f,%.4f to %.4f,%.4f", start_lat, start_lng, end_lat, end_lng)
 
     try:
         # Step 1: Find the nearest road nodes to our start and end points
@@ -318,106 +680,209 @@ def find_route(start_lat: float, start_lng: float,
         if start_node is None or end_node is None:
             return {'error': 'Could not find nearby roads within search radius'}
 
-        print(f"Start node: {start_node} (distance: {start_dist:.6f}°)")
-        print(f"End node: {end_node} (distance: {end_dist:.6f}°)")
+        _log.debug("Start node: %s (distance: %.6f°)", start_node, start_dist)
+        _log.debug("End node: %s (distance: %.6f°)", end_node, end_dist)
 
-        # Step 2: Calculate shortest path using igraph (fast implementation)
-        if not (_fast_graph and _node_mapping):
+        # Step 2: Calculate shortest path (bidirectional A*)
+        if not (_fast_graph and _node_mapping and _adjacency):
             return {'error': 'Fast routing not available - network not properly initialized'}
 
-        path = _find_route_igraph(start_node, end_node, start_lng, start_lat, end_lng, end_lat)
+        path = _find_shortest_route(start_node, end_node, start_lng, start_lat, end_lng, end_lat)
 
         return path
 
-    except nx.NetworkXNoPath:
-        return {'error': 'No route found - points may be on disconnected road segments'}
     except Exception as e:
         print(f"Pathfinding error: {e}")
         return {'error': f'Pathfinding failed: {str(e)}'}
 
 
-def _find_route_igraph(start_node: str, end_node: str,
-                      start_lng: float, start_lat: float,
-                      end_lng: float, end_lat: float) -> Dict[str, Any]:
+def _find_shortest_route(start_node: int, end_node: int,
+                         start_lng: float, start_lat: float,
+                         end_lng: float, end_lat: float) -> Dict[str, Any]:
     """
-    Find route using igraph library (optimized for speed)
+    Find route using bidirectional A* (optimized for speed)
 
-    igraph is a specialized graph library that implements Dijkstra's algorithm
-    very efficiently, optimized for large networks and high-performance routing.
+    Point-to-point queries only need the path to a single destination, so
+    searching from both ends at once, steered towards the goal by the
+    straight-line distance, settles far fewer nodes than plain Dijkstra.
     """
-    # Convert node names to indices for igraph
+    # Convert node keys to indices into the network arrays
     start_idx = _node_mapping['to_index'][start_node]
     end_idx = _node_mapping['to_index'][end_node]
 
-    # Run Dijkstra's shortest path algorithm
-    path_indices = _fast_graph.get_shortest_paths(
-        start_idx, end_idx, weights='weight', output="vpath")[0]
+    # Both points snapped to the same node: there is nothing to search
+    if start_idx == end_idx:
+        route = (1, 0.0, (), np.empty((0, 2), dtype=_coord_buffer.dtype))
+    else:
+        route = _route_between_nodes(start_idx, end_idx)
+    if route is None:
+        return {'error': 'No route found - points may be on disconnected road segments'}
 
-    # Convert indices back to node names
-    path = [_node_mapping['to_node'][idx] for idx in path_indices]
+    return _build_route_response(route, start_lng, start_lat, end_lng, end_lat)
 
-    return _build_route_response(_road_network, path,
-                                start_lng, start_lat, end_lng, end_lat)
 
+@lru_cache(maxsize=4096)
+def _route_between_nodes(start_idx: int, end_idx: int) -> Optional[Tuple[int, float, Tuple[str, ...], np.ndarray]]:
+    """
+    Calculate the route between two network nodes (memoized)
 
+    The result depends only on the snapped node pair, so repeated queries
+    between the same junctions - including clicks near an earlier one -
+    are served from the cache without running Dijkstra again.
 
-def _build_route_response(graph: nx.Graph, path: List[str],
-                        start_lng: float, start_lat: float,
-                        end_lng: float, end_lat: float) -> Dict[str, Any]:
+    Returns:
+        Tuple of (node count, distance in meters, roads used, read-only
+        (N, 2) coordinate array), or None if the nodes are not connected
+    """
+    # Read the path off a cached shortest path tree when there is one,
+    # otherwise run A* from both ends
+    tree_path = _path_from_tree(start_idx, end_idx)
+    if tree_path is not None:
+        path, edge_path = tree_path
+    else:
+        vpath, epath = routing.bidirectional_astar(_adjacency, _search_points,
+                                                   start_idx, end_idx)
+        path = vpath.tolist()
+        edge_path = epath.tolist()
+
+    if not path:
+        return None
+
+    # Calculate total distance and collect route information
+    # (edge weights are segment lengths in meters)
+    total_distance = float(_edge_weights[edge_path].sum())
+
+    route_parts = [np.empty((0, 2), dtype=_coord_buffer.dtype)]
+
+    # Full road geometry for every edge on the path, gathered in one go
+    if edge_path:
+        route_parts.append(_path_geometry(path, edge_path))
+
+    # Mark the road types used in a mask over the (sorted) type vocabulary
+    used_types = np.zeros(len(_road_type_names), dtype=bool)
+    used_types[_edge_road_type_ids[edge_path]] = True
+    roads_used = tuple(_road_type_names[used_types].tolist())
+
+    # Cached results are shared between requests, so make them read-only
+    route_coords = np.concatenate(route_parts)
+    route_coords.setflags(write=False)
+
+    return len(path), total_distance, roads_used, route_coords
+
+
+def _path_geometry(path: list, edge_path: list) -> np.ndarray:
+    """
+    Gather the coordinates along a path from the shared coordinate buffer
+
+    Builds one index array covering every edge - reversed where the path
+    runs against the stored geometry direction, and without the first point
+    of each later edge (the node shared with the previous edge) - and
+    copies all coordinates with a single fancy-indexing operation instead
+    of slicing and appending edge by edge.
+
+    Returns:
+        (N, 2) coordinate array running from path[0] to path[-1]
+    """
+    edge_ids = np.asarray(edge_path, dtype=np.int64)
+    starts = _edge_offsets[edge_ids]
+    ends = _edge_offsets[edge_ids + 1]
+    # Geometry is stored from the edge source; travelling from the other end reverses it
+    reverse = _edge_sources[edge_ids] != np.asarray(path[:-1], dtype=np.int64)
+
+    counts = ends - starts
+    edge_of_point = np.repeat(np.arange(edge_ids.size), counts)
+    position = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    index = np.where(reverse[edge_of_point],
+                     ends[edge_of_point] - 1 - position,
+                     starts[edge_of_point] + position)
+
+    # Skip the first point of every edge but the first to avoid duplicates
+    keep = (position > 0) | (edge_of_point == 0)
+    return _coord_buffer[index[keep]]
+
+
+def _path_from_tree(start_idx: int, end_idx: int) -> Optional[Tuple[list, list]]:
+    """
+    Look up a path in the shortest path tree rooted at the start node
+
+    Users typically pin a start point and try several destinations. The
+    first query from a start node uses a point-to-point search; once the
+    same start node comes up again, one full Dijkstra builds its shortest
+    path tree and every further destination is a walk up that tree.
+
+    Returns:
+        Tuple of (node path, edge path), or None if no tree is available yet
+    """
+    with _path_tree_lock:
+        tree = _path_trees.get(start_idx)
+        if tree is not None:
+            _path_trees.move_to_end(start_idx)
+        elif start_idx not in _recent_sources:
+            # First query from this node - remember it and search normally
+            _recent_sources[start_idx] = None
+            if len(_recent_sources) > _max_recent_sources:
+                _recent_sources.popitem(last=False)
+            return None
+
+    if tree is None:
+        tree = _build_path_tree(start_idx)
+        with _path_tree_lock:
+            _path_trees[start_idx] = tree
+            if len(_path_trees) > _max_path_trees:
+                _path_trees.popitem(last=False)
+
+    if end_idx != start_idx and tree[end_idx] < 0:
+        return [], []
+
+    # Walk the tree edges back from the destination to the start
+    path = [end_idx]
+    edge_path = []
+    node = end_idx
+    while node != start_idx:
+        edge_id = int(tree[node])
+        u, v = _edge_nodes[edge_id]
+        node = int(u if v == node else v)
+        edge_path.append(edge_id)
+        path.append(node)
+
+    path.reverse()
+    edge_path.reverse()
+    return path, edge_path
+
+
+def _build_path_tree(start_idx: int) -> np.ndarray:
+    """
+    Run a single-source Dijkstra and keep the shortest path tree
+
+    Uses SciPy's csgraph Dijkstra, which returns the whole tree as one
+    predecessor array from a single C call (or the Numba Dijkstra in
+    routing.py when SciPy is not installed).
+
+    Returns:
+        Array with the incoming tree edge for every node (-1 if unreachable)
+    """
+    return routing.shortest_path_tree(_adjacency, _csgraph, start_idx)
+
+
+def _build_route_response(route: Tuple[int, float, Tuple[str, ...], np.ndarray],
+                          start_lng: float, start_lat: float,
+                          end_lng: float, end_lat: float) -> Dict[str, Any]:
     """
     Build route response from the calculated path
 
-    This converts the abstract graph path (list of node IDs) into
-    geographic coordinates that can be displayed on a map.
+    This wraps the route geometry between network nodes with the actual
+    start and end points so it can be displayed on a map.
+
+    Coordinates are joined with a single np.concatenate and stay an (N, 2)
+    NumPy array, which /api/route streams out in chunks with orjson
+    (api._stream_route_json).
     """
-    # Calculate total distance and collect route information
-    total_distance = 0
-    roads_used = set()
-    route_coords = []
-
-    # Add start point to route
-    route_coords.append([start_lng, start_lat])
-
-    # Process each segment of the path
-    for i in range(len(path) - 1):
-        current_node = path[i]
-        next_node = path[i + 1]
-
-        # Get edge data for this segment
-        edge_data = graph.edges[current_node, next_node]
-        total_distance += edge_data['length']
-        roads_used.add(edge_data['road_type'])
-
-        # Add detailed geometry if available, otherwise use node coordinates
-        if 'geometry' in edge_data and edge_data['geometry']:
-            # Use the full road geometry for accurate route display
-            geometry = edge_data['geometry']
-            current_lat = graph.nodes[current_node]['lat']
-            current_lon = graph.nodes[current_node]['lon']
-
-            if len(geometry) > 0:
-                first_point = geometry[0]
-                last_point = geometry[-1]
-
-                # Check which direction matches our path direction
-                dist_to_first = ((first_point[0] - current_lon)**2 + (first_point[1] - current_lat)**2)**0.5
-                dist_to_last = ((last_point[0] - current_lon)**2 + (last_point[1] - current_lat)**2)**0.5
-
-                if dist_to_last < dist_to_first:
-                    # Reverse the geometry to match our travel direction
-                    geometry = list(reversed(geometry))
-
-                # Add all intermediate points (skip first if not first segment to avoid duplicates)
-                start_idx = 1 if i > 0 else 0
-                for point in geometry[start_idx:]:
-                    route_coords.append([point[0], point[1]])
-        else:
-            # Fallback to just node coordinates
-            node_data = graph.nodes[next_node]
-            route_coords.append([node_data['lon'], node_data['lat']])
-
-    # Add end point to route
-    route_coords.append([end_lng, end_lat])
+    node_count, total_distance, roads_used, geometry = route
+
+    # Add start and end points to route
+    start_point = np.array([[start_lng, start_lat]], dtype=geometry.dtype)
+    end_point = np.array([[end_lng, end_lat]], dtype=geometry.dtype)
+    route_coords = np.concatenate((start_point, geometry, end_point))
 
     result = {
         'route': {
@@ -425,23 +890,23 @@ def _build_route_response(graph: nx.Graph, path: List[str],
             'coordinates': route_coords
         },
         'distance': total_distance,
-        'roads': sorted(list(roads_used)),
-        'nodes': len(path)
+        'roads': list(roads_used),
+        'nodes': node_count
     }
 
-    print(f"Route found: {total_distance/1000:.1f}km via {len(path)} nodes")
+    _log.debug("Route found: %.1fkm via %d nodes", total_distance / 1000, node_count)
     return result
 
 
 def get_network_info() -> Dict[str, Any]:
     """Get information about the current network for debugging"""
-    if _road_network is None:
+    if _fast_graph is None:
         return {"status": "No network built"}
 
     return {
-        "nodes": _road_network.number_of_nodes(),
-        "edges": _road_network.number_of_edges(),
-        "has_igraph": _fast_graph is not None
+        "nodes": _fast_graph.vcount(),
+        "edges": _fast_graph.ecount(),
+        "has_igraph": True
     }
 
 
@@ -6,6 +6,7 @@ Run this to start the RoadBox server
 
 import os
 import sys
+import logging
 import yaml
 from pathlib import Path
 
@@ -45,6 +46,10 @@ def start_server():
     # Load configuration
     config = load_config()
 
+    # Per-request route and feature messages are logged at DEBUG level and
+    # stay silent by default
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     print("Starting RoadBox Server...")
     print("="*50)
 
@@ -56,11 +61,15 @@ def start_server():
     def open_browser():
         webbrowser.open(f'http://localhost:{config["port"]}')
 
-    print()
-    print(f"🌐 Opening browser at http://localhost:{config['port']}")
+    # The reloader restarts the whole app in a child process (and again on
+    # every file change), so only use it for development with debug enabled
+    use_reloader = config.get('use_reloader', False) and config.get('debug', False)
 
-    # Open browser after short delay
-    Timer(2.0, open_browser).start()
+    # Open browser after short delay - once, not again in the reloader's child process
+    if not os.environ.get('WERKZEUG_RUN_MAIN'):
+        print()
+        print(f"🌐 Opening browser at http://localhost:{config['port']}")
+        Timer(2.0, open_browser).start()
 
     try:
         app.run(
@@ -68,7 +77,7 @@ def start_server():
             host=config['host'],
             port=config['port'],
             threaded=config['threaded'],
-            use_reloader=config['use_reloader']
+            use_reloader=use_reloader
         )
     except KeyboardInterrupt:
         print("\n👋 Server stopped by user")